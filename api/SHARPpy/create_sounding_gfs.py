@@ -17,12 +17,19 @@ default coordinates (48N, -70.5E).
 """
 
 import os
+
+# Set up Qt for headless operation before anything imports it
+os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
 import sys
 import argparse
+import tempfile
+import traceback
+import functools
+import contextlib
+from urllib.request import urlopen
+import certifi
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 
 import sharppy
@@ -35,32 +42,132 @@ import sharppy.sharptab.thermo as thermo
 
 # Import SHARPpy data source modules
 from datasources import data_source
-
-# Import SHARPpy GUI components for complete rendering
-from sharppy.viz.SPCWindow import SPCWindow
-from sutils.config import Config
-from datetime import datetime
 import platform
 
-# Set up Qt for headless operation
-import os
-os.environ['QT_QPA_PLATFORM'] = 'offscreen'
-from qtpy.QtWidgets import QApplication, QWidget
-from qtpy.QtCore import Qt, Signal
-QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
-QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+# The SHARPpy GUI components and Qt take a while to import, so they are only
+# imported on the first render by _get_app(), _load_config() and _get_gui()
+
+
+# Mean Earth radius used for great-circle distances
+EARTH_R_KM = 6371.0
+
+
+# Station coordinate arrays keyed by id() of the station list they were built from.
+# Each entry keeps a reference to its list so the id cannot be reused while cached.
+_coord_cache = {}
+_COORD_CACHE_SIZE = 8
+
+# Number of stations kept by the approximate prefilter in _nearest(), and the
+# distance beyond which its ranking is not trusted
+_NEAREST_CANDIDATES = 8
+_NEAREST_APPROX_MAX_KM = 1000.0
+
+
+def _station_coords(stations):
+    """
+    Get the station coordinates as arrays for vectorized distance calculations.
+
+    The arrays are cached per station list so repeated lookups against the
+    same list skip the conversion and the per-station trigonometry. They are
+    stored as float32, which resolves positions to well under a metre while
+    halving the memory the distance calculations have to stream through.
+
+    Parameters:
+    stations: List of station dictionaries
+
+    Returns:
+    Tuple of (latitudes in radians, cosine of latitudes, longitudes in radians)
+    float32 arrays
+    """
+    key = id(stations)
+    cached = _coord_cache.get(key)
+    if cached is None:
+        n = len(stations)
+        station_lats = np.fromiter((station['lat'] for station in stations), dtype=np.float64, count=n)
+        station_lons = np.fromiter((station['lon'] for station in stations), dtype=np.float64, count=n)
+        lat_rad = np.radians(station_lats)
+        cached = (lat_rad.astype(np.float32), np.cos(lat_rad).astype(np.float32),
+                  np.radians(station_lons).astype(np.float32), stations)
+
+        if len(_coord_cache) >= _COORD_CACHE_SIZE:
+            _coord_cache.pop(next(iter(_coord_cache)))
+        _coord_cache[key] = cached
+
+    return cached[:3]
 
-# Create QApplication instance for Qt widgets used in SHARPpy
-app = QApplication([])
 
-# Import matplotlib plotting functions
-from sharppy.plot.skew import draw_title, draw_dry_adiabats, draw_mixing_ratio_lines, draw_moist_adiabats
-from sharppy.plot.skew import plot_wind_axes, plot_wind_barbs, draw_heights, plot_sig_levels
-from sharppy.plot.skew import draw_effective_inflow_layer, plotHodo, draw_hodo_inset
-from matplotlib.ticker import ScalarFormatter, MultipleLocator, NullFormatter
-from matplotlib.collections import LineCollection
-import matplotlib.transforms as transforms
-import matplotlib.gridspec as gridspec
+def _nearest(stations, lat, lon):
+    """
+    Find the station closest to the given coordinates.
+
+    Parameters:
+    stations: List of station dictionaries
+    lat: Latitude
+    lon: Longitude
+
+    Returns:
+    Tuple of (station dictionary, distance in km)
+    """
+    lat_rad, cos_lat, lon_rad = _station_coords(stations)
+
+    # Query values match the station arrays so the math stays in float32
+    q_lat_rad = np.float32(np.radians(lat))
+    q_lon_rad = np.float32(np.radians(lon))
+    pi = np.float32(np.pi)
+
+    def haversine(candidates):
+        dlat = lat_rad[candidates] - q_lat_rad
+        dlon = lon_rad[candidates] - q_lon_rad
+        a = np.sin(dlat*0.5)**2 + cos_lat[candidates] * np.cos(q_lat_rad) * np.sin(dlon*0.5)**2
+        return 2 * EARTH_R_KM * np.arcsin(np.sqrt(a))
+
+    # Rank all stations with a cheap equirectangular approximation and only
+    # evaluate the full haversine formula for the closest few candidates
+    candidates = np.arange(len(stations))
+    if len(stations) > _NEAREST_CANDIDATES:
+        dlat = lat_rad - q_lat_rad
+        dlon = (lon_rad - q_lon_rad + pi) % (2*pi) - pi  # Wrap across the antimeridian
+        approx = dlat**2 + (cos_lat * dlon)**2
+        # Sorted so ties resolve to the first station in the list, as before
+        candidates = np.sort(np.argpartition(approx, _NEAREST_CANDIDATES)[:_NEAREST_CANDIDATES])
+    distances = haversine(candidates)
+
+    # The approximation degrades over long distances, so check every station
+    # when even the closest candidate is far away
+    if distances.min() > _NEAREST_APPROX_MAX_KM and len(candidates) < len(stations):
+        candidates = np.arange(len(stations))
+        distances = haversine(candidates)
+
+    idx = int(np.argmin(distances))
+    return stations[candidates[idx]], float(distances[idx])
+
+
+def _get_points(data_source):
+    """
+    Get the full station catalog of a data source.
+
+    DataSource objects only expose the points of their outlets, so these are
+    gathered here, skipping duplicate locations like getAvailableAtTime does.
+    The list is kept on the data source so its coordinate arrays stay cached.
+
+    Parameters:
+    data_source: SHARPpy DataSource object
+
+    Returns:
+    List of station dictionaries
+    """
+    points = getattr(data_source, '_all_points', None)
+    if points is None:
+        points = []
+        coords = set()
+        for outlet in data_source._outlets.values():
+            for point in outlet.getPoints():
+                if (point['lat'], point['lon']) not in coords:
+                    coords.add((point['lat'], point['lon']))
+                    points.append(point)
+        setattr(data_source, '_all_points', points)
+
+    return points
 
 
 def find_nearest_station(data_source, lat, lon, cycle_time=None):
@@ -85,33 +192,33 @@ def find_nearest_station(data_source, lat, lon, cycle_time=None):
     except Exception as e:
         print(f"Error getting available stations: {e}")
         # Fallback: use all points from the CSV
-        stations = data_source.getPoints()
+        stations = _get_points(data_source)
         print(f"Using fallback station list with {len(stations)} stations")
 
     if not stations:
         raise ValueError("No GFS stations available")
 
-    # Find nearest station
-    min_distance = float('inf')
-    nearest_station = None
+    nearest_station, min_distance = _nearest(stations, lat, lon)
 
-    for station in stations:
-        station_lat = station['lat']
-        station_lon = station['lon']
+    print(f"Nearest GFS station: {nearest_station['icao']} at {nearest_station['lat']:.2f}N, {nearest_station['lon']:.2f}E (distance: {min_distance:.1f} km)")
+    return nearest_station
 
-        # Calculate distance using haversine formula
-        dlat = np.radians(station_lat - lat)
-        dlon = np.radians(station_lon - lon)
-        a = np.sin(dlat/2)**2 + np.cos(np.radians(lat)) * np.cos(np.radians(station_lat)) * np.sin(dlon/2)**2
-        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
-        distance = 6371 * c  # Earth radius in km
 
-        if distance < min_distance:
-            min_distance = distance
-            nearest_station = station
+# SHARPpy data sources, loaded on first use by _get_data_sources()
+_data_sources = None
 
-    print(f"Nearest GFS station: {nearest_station['icao']} at {nearest_station['lat']:.2f}N, {nearest_station['lon']:.2f}E (distance: {min_distance:.1f} km)")
-    return nearest_station
+
+def _get_data_sources():
+    """
+    Get the SHARPpy data sources, parsing the data source files only once.
+
+    Returns:
+    Dictionary associating data source names to DataSource objects
+    """
+    global _data_sources
+    if _data_sources is None:
+        _data_sources = data_source.loadDataSources()
+    return _data_sources
 
 
 def get_latest_gfs_cycle(data_source):
@@ -138,6 +245,111 @@ def get_latest_gfs_cycle(data_source):
         return cycle_time
 
 
+# Downloaded BUFKIT files are kept per user, next to SHARPpy's own data
+BUFKIT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.sharppy', 'bufkit')
+
+# Cached files are named after the source id, since the ICAO code can be blank
+_BUFKIT_CACHE_FILE = 'bufkit_{srcid}_{cycle:%Y%m%d%H}.buf'
+
+# Seconds to wait on the BUFKIT server before giving up on a cycle
+_BUFKIT_TIMEOUT = 60
+
+
+def _prune_bufkit_cache(oldest_cycle):
+    """
+    Remove cached BUFKIT files of cycles older than the given one.
+
+    Parameters:
+    oldest_cycle: datetime of the oldest cycle still worth keeping
+    """
+    try:
+        names = os.listdir(BUFKIT_CACHE_DIR)
+    except FileNotFoundError:
+        return
+
+    oldest_cycle = oldest_cycle.replace(tzinfo=None)
+    for name in names:
+        # Also matches partial files left behind by interrupted downloads
+        stem = name.partition('.buf')[0]
+        if not stem.startswith('bufkit_'):
+            continue
+        try:
+            cycle = datetime.strptime(stem.rsplit('_', 1)[1], '%Y%m%d%H')
+        except ValueError:
+            continue
+
+        if cycle < oldest_cycle:
+            try:
+                os.remove(os.path.join(BUFKIT_CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+@functools.lru_cache(maxsize=16)
+def _load_profile(decoder_class, url, bufkit_file):
+    """
+    Decode a BUFKIT file, downloading it to bufkit_file first if needed.
+
+    Decoded profiles are kept for the most recent files, and the downloaded
+    files persist in BUFKIT_CACHE_DIR so later runs skip the download.
+
+    Parameters:
+    decoder_class: SHARPpy decoder class for the file format
+    url: URL of the BUFKIT file
+    bufkit_file: Local path of the BUFKIT file
+
+    Returns:
+    SHARPpy Profile object
+    """
+    if os.path.exists(bufkit_file):
+        try:
+            return _decode_profile(decoder_class, bufkit_file)
+        except Exception as e:
+            # Drop a cached file that can't be decoded and fetch it again
+            print(f"Discarding cached GFS data that failed to decode: {e}")
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(bufkit_file)
+
+    # Use certifi's CA bundle like SHARPpy's own downloads, frozen builds rely on it
+    with urlopen(url, timeout=_BUFKIT_TIMEOUT, cafile=certifi.where()) as response:
+        data = response.read()
+
+    os.makedirs(os.path.dirname(bufkit_file), mode=0o700, exist_ok=True)
+
+    # Write and decode under a unique name, and only move the file into place
+    # once it decodes, so neither bad responses nor partial files get cached
+    partial_file = f"{bufkit_file}.{os.getpid()}"
+    try:
+        with open(partial_file, 'wb') as f:
+            f.write(data)
+        prof = _decode_profile(decoder_class, partial_file)
+        os.replace(partial_file, bufkit_file)
+    finally:
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
+
+    return prof
+
+
+def _decode_profile(decoder_class, bufkit_file):
+    """
+    Decode the first profile of a local BUFKIT file.
+
+    Parameters:
+    decoder_class: SHARPpy decoder class for the file format
+    bufkit_file: Local path of the BUFKIT file
+
+    Returns:
+    SHARPpy Profile object
+    """
+    # Create decoder instance and parse the data
+    decoder_instance = decoder_class(bufkit_file)
+    prof_collection = decoder_instance.getProfiles()
+
+    # Get the profile (usually the first/only profile in the collection)
+    return prof_collection.getHighlightedProf()
+
+
 def download_gfs_profile(data_source, station, cycle_time):
     """
     Download and decode GFS BUFKIT data for a specific station and cycle.
@@ -153,16 +365,16 @@ def download_gfs_profile(data_source, station, cycle_time):
     try:
         # Get decoder class and URL
         decoder_class, url = data_source.getDecoderAndURL(station, cycle_time)
-        print(f"Downloading GFS data from: {url}")
 
-        # Create decoder instance and parse the data
-        decoder_instance = decoder_class(url)
-        prof_collection = decoder_instance.getProfiles()
+        bufkit_file = os.path.join(BUFKIT_CACHE_DIR, _BUFKIT_CACHE_FILE.format(srcid=station['srcid'], cycle=cycle_time))
+        if os.path.exists(bufkit_file):
+            print(f"Using cached GFS data: {bufkit_file}")
+        else:
+            print(f"Downloading GFS data from: {url}")
 
-        # Get the profile (usually the first/only profile in the collection)
-        prof = prof_collection.getHighlightedProf()
+        prof = _load_profile(decoder_class, url, bufkit_file)
 
-        print(f"Successfully downloaded GFS profile for {station['icao']}")
+        print(f"Loaded GFS profile for {station['icao']}")
         print(f"Profile location: {prof.location}")
         print(f"Profile time: {prof.date}")
         print(f"Profile has {len(prof.pres)} levels")
@@ -187,89 +399,268 @@ def create_sounding_plot(prof, output_file='sounding.png', title='GFS Atmospheri
     create_sharppy_gui_image(prof, output_file, title)
 
 
-def create_sharppy_gui_image(prof, output_file='sounding.png', title='GFS Atmospheric Sounding'):
+# SHARPpy configuration file shared by all renders, kept per user like BUFKIT_CACHE_DIR
+CFG_PATH = os.path.join(os.path.expanduser('~'), '.sharppy', 'sharppy_gfs.ini')
+
+# Configuration sections SHARPpy's GUI needs besides the user preferences
+_CFG_DEFAULTS = {
+    ('insets', 'left_inset'): 'SARS',
+    ('insets', 'right_inset'): 'STP STATS',
+    ('parcel_types', 'pcl1'): 'SFC',
+    ('parcel_types', 'pcl2'): 'ML',
+    ('parcel_types', 'pcl3'): 'FCST',
+    ('parcel_types', 'pcl4'): 'MU',
+}
+
+# QApplication for the Qt widgets used in SHARPpy, created on first use by _get_app()
+_APP = None
+
+# Off-screen SHARPpy GUI reused across renders, created on first use by _get_gui()
+_GUI = None
+
+
+def _get_app():
     """
-    Create a comprehensive sounding plot using SHARPpy's complete GUI rendering system.
-    This replicates the exact same output as the SHARPpy GUI when clicking "Generate Profiles".
+    Get the QApplication, creating it on the first call.
+
+    Returns:
+    QApplication instance
     """
+    global _APP
+    if _APP is None:
+        from qtpy.QtWidgets import QApplication
+        from qtpy.QtCore import Qt, QLibraryInfo
+
+        # Point Qt straight at its platform plugins instead of searching for them
+        platforms_dir = os.path.join(QLibraryInfo.location(QLibraryInfo.PluginsPath), 'platforms')
+        if os.path.isdir(platforms_dir):
+            os.environ.setdefault('QT_QPA_PLATFORM_PLUGIN_PATH', platforms_dir)
+
+        # These attributes only take effect before the application is constructed
+        if QApplication.instance() is None:
+            QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+            QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+        _APP = QApplication.instance() or QApplication([])
+    return _APP
+
+
+def _load_config():
+    """
+    Load the SHARPpy configuration from CFG_PATH.
+
+    The file is only (re)initialized when it is missing or older than this
+    script, so later runs skip the preference setup.
+
+    Returns:
+    SHARPpy Config object
+    """
+    from sutils.config import Config
+
+    script = sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(__file__)
+    if os.path.exists(CFG_PATH) and os.path.getmtime(CFG_PATH) >= os.path.getmtime(script):
+        return Config(CFG_PATH)
+
+    # Build the configuration in a private file and move it into place, so
+    # concurrent runs never read a partially written file
+    cfg_dir = os.path.dirname(CFG_PATH)
+    os.makedirs(cfg_dir, exist_ok=True)
+    fd, build_path = tempfile.mkstemp(suffix='.ini', dir=cfg_dir)
+    os.close(fd)
     try:
-        print("Creating comprehensive GFS sounding plot using SHARPpy GUI...")
-
-        # Initialize Qt application for off-screen rendering
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-
-        # Create a ProfCollection to hold our profile (like the GUI does)
-        import sharppy.sharptab.prof_collection as prof_collection
-        prof_col = prof_collection.ProfCollection(
-            {'':[ prof ]},
-            [ prof.date ],
-        )
-
-        # Set metadata like the GUI does
-        prof_col.setMeta('model', 'GFS')
-        prof_col.setMeta('run', prof.date)
-        prof_col.setMeta('base_time', prof.date)  # Base time for forecast hour calculation
-        prof_col.setMeta('loc', title)
-        prof_col.setMeta('fhour', 0)  # Analysis profile
-        prof_col.setMeta('observed', False)  # This is model data
-
-        # Create configuration object with a temporary config file
-        import tempfile
-        temp_config = tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False)
-        temp_config.close()
-
-        config = Config(temp_config.name)
+        config = Config(build_path)
 
         # Initialize preferences like the GUI does
         from sharppy.viz.preferences import PrefDialog
         PrefDialog.initConfig(config)
 
         # Initialize other config sections
-        config.initialize({
-            ('insets', 'left_inset'): 'SARS',
-            ('insets', 'right_inset'): 'STP STATS',
-            ('parcel_types', 'pcl1'): 'SFC',
-            ('parcel_types', 'pcl2'): 'ML',
-            ('parcel_types', 'pcl3'): 'FCST',
-            ('parcel_types', 'pcl4'): 'MU',
-            ('paths', 'save_img'): os.path.dirname(output_file) or os.getcwd(),
-            ('paths', 'save_txt'): os.path.dirname(output_file) or os.getcwd(),
-        })
+        config.initialize(_CFG_DEFAULTS)
 
-        # Create a dummy parent object with the required signal and methods
-        class DummyParent(QWidget):
-            config_changed = Signal(Config)
+        config.toFile()
+        os.replace(build_path, CFG_PATH)
+    finally:
+        if os.path.exists(build_path):
+            os.remove(build_path)
+    return config
 
-            def preferencesbox(self):
-                pass  # Dummy method
 
-        dummy_parent = DummyParent()
+def _get_gui():
+    """
+    Get the off-screen SHARPpy GUI, creating it on the first call.
 
-        # Create SPCWindow (off-screen) with dummy parent
-        spc_window = SPCWindow(parent=dummy_parent, cfg=config)
+    Building the Qt application, the configuration and the SPCWindow
+    dominates the render time, so they are created once and reused.
 
-        # Add the profile collection (this triggers all the GUI rendering)
-        spc_window.addProfileCollection(prof_col, focus=True)
+    Returns:
+    Dictionary holding the QApplication, Config, parent widget and SPCWindow
+    """
+    global _GUI
+    if _GUI is not None:
+        return _GUI
 
-        # Save the complete GUI image using the same method as the GUI
-        spc_window.spc_widget.pixmapToFile(output_file)
+    # Initialize Qt application for off-screen rendering
+    app = _get_app()
 
-        # Check if file was actually created
-        if os.path.exists(output_file):
-            file_size = os.path.getsize(output_file)
-            print(f"SHARPpy GUI GFS sounding plot saved to {output_file} ({file_size} bytes)")
-        else:
-            raise Exception(f"Failed to save image to {output_file}")
+    from qtpy.QtWidgets import QWidget
+    from qtpy.QtCore import Signal
+    from sharppy.viz.SPCWindow import SPCWindow
+    from sutils.config import Config
+
+    config = _load_config()
+
+    # Create a dummy parent object with the required signal and methods
+    class DummyParent(QWidget):
+        config_changed = Signal(Config)
+
+        def preferencesbox(self):
+            pass  # Dummy method
+
+    dummy_parent = DummyParent()
+
+    # Create SPCWindow (off-screen) with dummy parent
+    spc_window = SPCWindow(parent=dummy_parent, cfg=config)
+
+    _GUI = {
+        'app': app,
+        'config': config,
+        'parent': dummy_parent,
+        'window': spc_window,
+        'menu_name': None,  # Name of the profile collection currently shown
+    }
+    return _GUI
+
+
+def _detach_profile_collection(spc_window, menu_name):
+    """
+    Remove a profile collection from the SPCWindow without redrawing it.
+
+    SPCWindow.rmProfileCollection redraws the remaining collections and fails
+    when none are left, so this mirrors it without the redraw. The following
+    addProfileCollection call then redraws everything once.
+
+    Parameters:
+    spc_window: SHARPpy SPCWindow object
+    menu_name: Name of the collection, as returned by createMenuName
+    """
+    from qtpy.QtCore import QCoreApplication, QEvent
+
+    # removeProfileMenu only hides the menu, so take it out of menu_items and
+    # delete it, with the Focus/Remove actions the window owns
+    for prof_menu in [mitem for mitem in spc_window.menu_items if mitem.title() == menu_name]:
+        spc_window.menu_items.remove(prof_menu)
+        for action in prof_menu.actions():
+            spc_window.focus_mapper.removeMappings(action)
+            spc_window.remove_mapper.removeMappings(action)
+            action.deleteLater()
+        spc_window.profilemenu.removeAction(prof_menu.menuAction())
+        prof_menu.deleteLater()
+
+    # No event loop runs off-screen, so carry out the deletions right away
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    spc_widget = spc_window.spc_widget
+    idx = spc_widget.prof_ids.index(menu_name)
+    prof_col = spc_widget.prof_collections.pop(idx)
+    spc_widget.prof_ids.pop(idx)
+    spc_widget.sound.rmProfileCollection(prof_col)
+    spc_widget.hodo.rmProfileCollection(prof_col)
+
+
+def _discard_gui():
+    """
+    Throw away the reused SHARPpy GUI so the next render builds a new one.
+
+    A render that fails part way can leave its profile collection behind in
+    the SPCWindow, where later renders would draw it as an extra profile.
+    """
+    global _GUI
+    if _GUI is None:
+        return
+
+    from qtpy.QtCore import QCoreApplication, QEvent
+
+    _GUI['window'].deleteLater()
+    _GUI['parent'].deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    _GUI = None
+
+
+# Qt maps PNG quality to a zlib level as (100 - quality) * 9 / 91, so 89 is level 1
+_PNG_QUALITY = 89
+
+
+def _save_widget_image(widget, output_file):
+    """
+    Save a rendering of a Qt widget to an image file.
+
+    This matches SPCWidget.pixmapToFile, except that PNG files use fast
+    compression instead of being written uncompressed.
 
-        # Clean up
-        spc_window.close()
+    Parameters:
+    widget: Qt widget to render
+    output_file: Output image file path, the format follows its extension
+    """
+    fmt = output_file.split(".")[-1].upper()
+    quality = _PNG_QUALITY if fmt == 'PNG' else 100
+
+    # An existing image from an earlier run would pass a later existence
+    # check, so a failed save has to be reported here
+    if not widget.grab().save(output_file, fmt, quality):
+        raise Exception(f"Failed to save image to {output_file}")
 
+
+def create_sharppy_gui_image(prof, output_file='sounding.png', title='GFS Atmospheric Sounding'):
+    """
+    Create a comprehensive sounding plot using SHARPpy's complete GUI rendering system.
+    This replicates the exact same output as the SHARPpy GUI when clicking "Generate Profiles".
+    """
+    print("Creating comprehensive GFS sounding plot using SHARPpy GUI...")
+
+    gui = _get_gui()
+    spc_window = gui['window']
+
+    # Create a ProfCollection to hold our profile (like the GUI does)
+    import sharppy.sharptab.prof_collection as prof_collection
+    prof_col = prof_collection.ProfCollection(
+        {'':[ prof ]},
+        [ prof.date ],
+    )
+
+    # Set metadata like the GUI does
+    prof_col.setMeta('model', 'GFS')
+    prof_col.setMeta('run', prof.date)
+    prof_col.setMeta('base_time', prof.date)  # Base time for forecast hour calculation
+    prof_col.setMeta('loc', title)
+    prof_col.setMeta('fhour', 0)  # Analysis profile
+    prof_col.setMeta('observed', False)  # This is model data
+
+    # Point the GUI's save dialogs at the output directory
+    gui['config']['paths', 'save_img'] = os.path.dirname(output_file) or os.getcwd()
+    gui['config']['paths', 'save_txt'] = os.path.dirname(output_file) or os.getcwd()
+
+    # Replace the previously rendered profile collection
+    if gui['menu_name'] is not None:
+        _detach_profile_collection(spc_window, gui['menu_name'])
+        gui['menu_name'] = None
+
+    try:
+        # Add the profile collection (this triggers all the GUI rendering)
+        spc_window.addProfileCollection(prof_col, focus=True)
+        gui['menu_name'] = spc_window.createMenuName(prof_col)
+
+        # Save the complete GUI image like the GUI does
+        _save_widget_image(spc_window.spc_widget, output_file)
     except Exception as e:
         print(f"Error in SHARPpy GUI rendering: {e}")
-        import traceback
-        traceback.print_exc()
+        _discard_gui()
+        raise
+
+    # Check if file was actually created
+    if os.path.exists(output_file):
+        file_size = os.path.getsize(output_file)
+        print(f"SHARPpy GUI GFS sounding plot saved to {output_file} ({file_size} bytes)")
+    else:
+        raise Exception(f"Failed to save image to {output_file}")
 
 
 def generate_gfs_sounding(lat, lon, output_file='sounding_gfs.png', title=None):
@@ -289,7 +680,7 @@ def generate_gfs_sounding(lat, lon, output_file='sounding_gfs.png', title=None):
 
     # Load SHARPpy data sources
     print("Loading SHARPpy data sources...")
-    data_sources = data_source.loadDataSources()
+    data_sources = _get_data_sources()
 
     if 'GFS' not in data_sources:
         raise ValueError("GFS data source not available")
@@ -301,60 +692,67 @@ def generate_gfs_sounding(lat, lon, output_file='sounding_gfs.png', title=None):
     station = None
     cycle_time = None
 
-    # Try the last few cycles (current and previous)
-    for hours_back in [0, 6, 12, 18, 24]:
+    # Try the most recent published cycle first, then the ones before it
+    latest_cycle = get_latest_gfs_cycle(gfs_source)
+    test_cycles = [latest_cycle - timedelta(hours=6 * i) for i in range(5)]
+
+    # Files of cycles older than any that is tried can't be used again
+    _prune_bufkit_cache(test_cycles[-1])
+
+    # The nearest station is the same for every cycle whenever it is available,
+    # so look it up once in the full catalog. Without a catalog every cycle's
+    # own station list is searched instead.
+    try:
+        catalog = _get_points(gfs_source)
+    except Exception as e:
+        print(f"Error reading GFS station catalog: {e}")
+        catalog = []
+
+    preferred_station = preferred_distance = None
+    if catalog:
+        preferred_station, preferred_distance = _nearest(catalog, lat, lon)
+    stations_found = bool(catalog)
+
+    # Check the cycles one at a time from the newest, so older cycles are only
+    # queried when the newer ones have no data
+    for test_cycle in test_cycles:
+        print(f"Trying cycle: {test_cycle}")
+
+        # Get available stations for this cycle
         try:
-            test_cycle = datetime.utcnow() - timedelta(hours=hours_back)
-            test_cycle = test_cycle.replace(hour=(test_cycle.hour // 6) * 6, minute=0, second=0, microsecond=0)
+            available_stations = gfs_source.getAvailableAtTime(test_cycle)
+        except Exception as e:
+            print(f"Error checking cycle {test_cycle}: {e}")
+            continue
 
-            print(f"Trying cycle: {test_cycle}")
+        if not available_stations:
+            continue
+        stations_found = True
 
-            # Get available stations for this cycle
-            try:
-                available_stations = gfs_source.getAvailableAtTime(test_cycle)
-                if available_stations:
-                    print(f"Found {len(available_stations)} available stations for cycle {test_cycle}")
-
-                    # Find nearest available station
-                    min_distance = float('inf')
-                    nearest_station = None
-
-                    for avail_station in available_stations:
-                        station_lat = avail_station['lat']
-                        station_lon = avail_station['lon']
-
-                        # Calculate distance
-                        dlat = np.radians(station_lat - lat)
-                        dlon = np.radians(station_lon - lon)
-                        a = np.sin(dlat/2)**2 + np.cos(np.radians(lat)) * np.cos(np.radians(station_lat)) * np.sin(dlon/2)**2
-                        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
-                        distance = 6371 * c  # Earth radius in km
-
-                        if distance < min_distance:
-                            min_distance = distance
-                            nearest_station = avail_station
-
-                    if nearest_station:
-                        print(f"Nearest available station: {nearest_station['icao']} at {nearest_station['lat']:.2f}N, {nearest_station['lon']:.2f}E (distance: {min_distance:.1f} km)")
-
-                        # Try to download the profile
-                        try:
-                            prof = download_gfs_profile(gfs_source, nearest_station, test_cycle)
-                            station = nearest_station
-                            cycle_time = test_cycle
-                            break
-                        except Exception as e:
-                            print(f"Failed to download profile for {nearest_station['icao']}: {e}")
-                            continue
-            except Exception as e:
-                print(f"Error checking cycle {test_cycle}: {e}")
-                continue
+        print(f"Found {len(available_stations)} available stations for cycle {test_cycle}")
 
+        # Find nearest available station, only searching again when the
+        # nearest catalog station is missing from this cycle
+        available_ids = {avail_station['srcid'] for avail_station in available_stations}
+        if preferred_station is not None and preferred_station['srcid'] in available_ids:
+            nearest_station, min_distance = preferred_station, preferred_distance
+        else:
+            nearest_station, min_distance = _nearest(available_stations, lat, lon)
+        print(f"Nearest available station: {nearest_station['icao']} at {nearest_station['lat']:.2f}N, {nearest_station['lon']:.2f}E (distance: {min_distance:.1f} km)")
+
+        # Try to download the profile
+        try:
+            prof = download_gfs_profile(gfs_source, nearest_station, test_cycle)
+            station = nearest_station
+            cycle_time = test_cycle
+            break
         except Exception as e:
-            print(f"Error with cycle {test_cycle}: {e}")
+            print(f"Failed to download profile for {nearest_station['icao']}: {e}")
             continue
 
     if prof is None:
+        if not stations_found:
+            raise ValueError("No GFS stations available")
         raise ValueError("Could not find available GFS data for any recent cycle")
 
     # Generate title if not provided
@@ -382,7 +780,6 @@ def test_gfs_sounding():
         return True
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 